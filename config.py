@@ -0,0 +1,24 @@
+"""
+Application Settings
+
+Environment configuration read once at import time. Import `settings` instead
+of calling os.getenv in request handlers.
+"""
+
+from typing import Optional
+from dotenv import load_dotenv
+from pydantic_settings import BaseSettings
+
+# Load environment variables from .env file
+load_dotenv()
+
+class Settings(BaseSettings):
+    database_url: Optional[str] = None
+    database_name: Optional[str] = None
+    atlas_search_index: Optional[str] = None
+    # comma separated explicit origins, plus a regex matching local frontends
+    cors_origins: str = ""
+    cors_origin_regex: Optional[str] = r"https?://localhost(:[0-9]+)?"
+    port: int = 8000
+
+settings = Settings()
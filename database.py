@@ -5,51 +5,126 @@ MongoDB helper functions ready to use in your backend code.
 Import and use these functions in your API endpoints for database operations.
 """
 
-from pymongo import MongoClient
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import BulkWriteError
 from datetime import datetime, timezone
-import os
-from dotenv import load_dotenv
-from typing import Union
+from typing import List, Tuple, Union
 from pydantic import BaseModel
 
-# Load environment variables from .env file
-load_dotenv()
+from config import settings
 
 _client = None
 db = None
 
-database_url = os.getenv("DATABASE_URL")
-database_name = os.getenv("DATABASE_NAME")
+database_url = settings.database_url
+database_name = settings.database_name
 
 if database_url and database_name:
-    _client = MongoClient(database_url)
+    _client = AsyncIOMotorClient(
+        database_url,
+        maxPoolSize=100,
+        minPoolSize=10,
+        # fail fast instead of hanging requests when the pool or server is unavailable
+        waitQueueTimeoutMS=2000,
+        serverSelectionTimeoutMS=3000,
+        # zstd when the server supports it, zlib (stdlib) otherwise
+        compressors="zstd,zlib",
+    )
     db = _client[database_name]
 
 # Helper functions for common database operations
-def create_document(collection_name: str, data: Union[BaseModel, dict]):
-    """Insert a single document with timestamp"""
+def _collection(collection_name: str):
+    """Return the collection, failing if the database is not configured"""
     if db is None:
         raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
+    return db[collection_name]
+
+def _stringify_id(document: dict) -> dict:
+    """ObjectId is not JSON serializable, expose ids as strings like create_document does"""
+    if "_id" in document:
+        document["_id"] = str(document["_id"])
+    return document
+
+def _find(collection_name: str, filter_dict: dict = None, limit: int = None, sort: list = None, projection: dict = None):
+    """Build a find cursor with optional sort and limit"""
+    cursor = _collection(collection_name).find(filter_dict or {}, projection)
+    if sort:
+        cursor = cursor.sort(sort)
+    if limit:
+        cursor = cursor.limit(limit)
+    return cursor
 
-    # Convert Pydantic model to dict if needed
+def _to_document(data: Union[BaseModel, dict], now: datetime) -> dict:
+    """Convert a payload to a timestamped dict ready for insertion"""
+    # Convert Pydantic model to dict if needed; unset optional fields are not stored
     if isinstance(data, BaseModel):
-        data_dict = data.model_dump()
+        data_dict = data.model_dump(exclude_none=True, by_alias=True)
     else:
         data_dict = data.copy()
 
-    data_dict['created_at'] = datetime.now(timezone.utc)
-    data_dict['updated_at'] = datetime.now(timezone.utc)
+    data_dict['created_at'] = now
+    data_dict['updated_at'] = now
+    return data_dict
 
-    result = db[collection_name].insert_one(data_dict)
+async def create_document(collection_name: str, data: Union[BaseModel, dict]):
+    """Insert a single document with timestamp"""
+    data_dict = _to_document(data, datetime.now(timezone.utc))
+
+    result = await _collection(collection_name).insert_one(data_dict)
     return str(result.inserted_id)
 
-def get_documents(collection_name: str, filter_dict: dict = None, limit: int = None):
+async def create_documents(collection_name: str, data: List[Union[BaseModel, dict]]) -> Tuple[List[str], List[dict]]:
+    """Insert many documents with timestamps in a single round trip.
+
+    Returns the inserted ids and the write errors of documents that failed.
+    """
+    if not data:
+        return [], []
+
+    now = datetime.now(timezone.utc)
+    docs = [_to_document(item, now) for item in data]
+
+    # unordered lets the server apply the inserts in parallel
+    try:
+        result = await _collection(collection_name).insert_many(docs, ordered=False)
+    except BulkWriteError as e:
+        # the rest of the batch is still written, ids were assigned client side
+        write_errors = e.details.get("writeErrors", [])
+        failed = {error["index"] for error in write_errors}
+        ids = [str(doc["_id"]) for index, doc in enumerate(docs) if index not in failed]
+        errors = [{"index": error["index"], "code": error.get("code"), "errmsg": error.get("errmsg")} for error in write_errors]
+        return ids, errors
+    return [str(_id) for _id in result.inserted_ids], []
+
+async def get_documents(collection_name: str, filter_dict: dict = None, limit: int = None, sort: list = None, projection: dict = None):
     """Get documents from collection"""
-    if db is None:
-        raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
-    
-    cursor = db[collection_name].find(filter_dict or {})
-    if limit:
-        cursor = cursor.limit(limit)
-    
-    return list(cursor)
+    cursor = _find(collection_name, filter_dict, limit, sort, projection)
+
+    documents = await cursor.to_list(length=limit)
+    return [_stringify_id(document) for document in documents]
+
+async def iter_documents(collection_name: str, filter_dict: dict = None, limit: int = None, sort: list = None, projection: dict = None):
+    """Yield documents from collection as the cursor produces them"""
+    cursor = _find(collection_name, filter_dict, limit, sort, projection)
+
+    async for document in cursor:
+        yield _stringify_id(document)
+
+async def iter_aggregate(collection_name: str, pipeline: list):
+    """Yield aggregation results as the cursor produces them"""
+    async for document in _collection(collection_name).aggregate(pipeline):
+        yield _stringify_id(document)
+
+async def aggregate_documents(collection_name: str, pipeline: list, limit: int = None, nested: List[str] = None):
+    """Run an aggregation pipeline on a collection.
+
+    `nested` names array fields holding joined documents (e.g. from $lookup)
+    whose ids are stringified as well.
+    """
+    documents = await _collection(collection_name).aggregate(pipeline).to_list(length=limit)
+    for document in documents:
+        _stringify_id(document)
+        for field in nested or []:
+            for related in document.get(field, []):
+                _stringify_id(related)
+    return documents
@@ -1,28 +1,60 @@
-import os
-from fastapi import FastAPI, HTTPException, Query
+import re
+import time
+import logging
+import orjson
+from fastapi import Body, Depends, FastAPI, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from fastapi_cache import FastAPICache
+from fastapi_cache.decorator import cache
 from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+from bson import ObjectId
+from bson.errors import InvalidId
 
-from database import db, create_document, get_documents
+from config import settings
+from database import db, create_document, create_documents, get_documents, aggregate_documents, iter_documents, iter_aggregate
+from response_cache import BoundedInMemoryBackend, JsonBodyCoder
 from schemas import Client, Case, Task, Invoice, Setting, LegalDocument, AssistantMessage
 
-app = FastAPI(title="Legal Management System API")
+app = FastAPI(title="Legal Management System API", default_response_class=ORJSONResponse)
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+logger = logging.getLogger(__name__)
+
+# Explicit CORS origins for when uvicorn is served directly (start_server.sh).
+# Behind nginx.conf the proxy answers preflights and replaces these headers;
+# both match the same localhost default and CORS_ORIGINS adds deployed frontends.
+cors_origins = [origin.strip() for origin in settings.cors_origins.split(",") if origin.strip()]
+if cors_origins or settings.cors_origin_regex:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=cors_origins,
+        allow_origin_regex=settings.cors_origin_regex,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
 
 @app.get("/")
-def read_root():
+async def read_root():
     return {"message": "Legal Management System Backend Running"}
 
+# /test is used as a liveness probe, so the listCollections result is reused
+# for a few seconds instead of hitting MongoDB on every probe.
+COLLECTIONS_CACHE_TTL = 5
+_collections_cache: Tuple[float, List[str]] = (0.0, [])
+
+async def _list_collection_names() -> List[str]:
+    global _collections_cache
+    expires_at, names = _collections_cache
+    now = time.monotonic()
+    if now >= expires_at:
+        names = await db.list_collection_names()
+        _collections_cache = (now + COLLECTIONS_CACHE_TTL, names)
+    return names
+
 @app.get("/test")
-def test_database():
+async def test_database():
     response = {
         "backend": "✅ Running",
         "database": "❌ Not Available",
@@ -34,11 +66,11 @@ def test_database():
     try:
         if db is not None:
             response["database"] = "✅ Available"
-            response["database_url"] = "✅ Set" if os.getenv("DATABASE_URL") else "❌ Not Set"
-            response["database_name"] = os.getenv("DATABASE_NAME") or ""
+            response["database_url"] = "✅ Set" if settings.database_url else "❌ Not Set"
+            response["database_name"] = settings.database_name or ""
             response["connection_status"] = "Connected"
             try:
-                collections = db.list_collection_names()
+                collections = await _list_collection_names()
                 response["collections"] = collections[:20]
                 response["database"] = "✅ Connected & Working"
             except Exception as e:
@@ -49,56 +81,280 @@ def test_database():
         response["database"] = f"❌ Error: {str(e)[:120]}"
     return response
 
-# Utility function for simple queries
+# Indexes
+
+# Collections searched through _query. MongoDB allows a single text index per
+# collection, so each one gets a compound text index over every searchable key.
+TEXT_SEARCH_COLLECTIONS = ["client", "case", "legaldocument"]
+TEXT_SEARCH_FIELDS = ["title", "name", "description", "content"]
+
+# Compound indexes matching the filters of each list endpoint. Keys follow the
+# Equality-Sort-Range rule: equality filters first, then sort, then range keys.
+COMPOUND_INDEXES = {
+    "case": [[("client_id", 1), ("status", 1)]],
+    "task": [[("case_id", 1), ("status", 1), ("assignee_id", 1)]],
+    "invoice": [[("client_id", 1), ("case_id", 1), ("status", 1)], [("case_id", 1), ("status", 1)]],
+    "setting": [[("scope", 1), ("user_id", 1)]],
+    "assistantmessage": [[("conversation_id", 1), ("related_case_id", 1)]],
+    "legaldocument": [[("practice_area", 1), ("jurisdiction", 1), ("year", -1)]],
+}
+
+# Field matched by the `prefix` query parameter. Anchored, case-sensitive regexes
+# can walk a plain B-tree index, so each of these gets a single-field index.
+PREFIX_SEARCH_FIELDS = {
+    "client": "name",
+    "case": "title",
+    "legaldocument": "title",
+}
+
+# Atlas Search index name, set ATLAS_SEARCH_INDEX when running on Atlas. The
+# listed collections then route `q` through a $search stage instead of $text.
+# Filter fields are indexed too, so they run inside $search (compound.filter)
+# instead of as a $match over every text hit.
+ATLAS_SEARCH_INDEX = settings.atlas_search_index
+ATLAS_SEARCH_FIELDS = {
+    "legaldocument": {
+        "text": ["title", "content"],
+        "filters": {"practice_area": "token", "jurisdiction": "token", "year": "number"},
+    },
+}
+
+def _atlas_search_definition(collection: str) -> Dict[str, Any]:
+    config = ATLAS_SEARCH_FIELDS[collection]
+    fields: Dict[str, Any] = {field: {"type": "string"} for field in config["text"]}
+    for field, field_type in config["filters"].items():
+        fields[field] = {"type": field_type}
+    prefix_field = PREFIX_SEARCH_FIELDS.get(collection)
+    if prefix_field in fields:
+        # keyword-analyzed copy for case-sensitive prefix wildcards
+        fields[prefix_field] = {
+            **fields[prefix_field],
+            "multi": {"keyword": {"type": "string", "analyzer": "lucene.keyword"}},
+        }
+    return {"mappings": {"dynamic": False, "fields": fields}}
+
+@app.on_event("startup")
+async def ensure_indexes():
+    if db is None:
+        return
+    # one index at a time, so a conflict on one leaves the others in place
+    specs: List[Tuple[str, Any, Dict[str, Any]]] = []
+    for collection in TEXT_SEARCH_COLLECTIONS:
+        specs.append((collection, [(field, "text") for field in TEXT_SEARCH_FIELDS], {"name": "text_search"}))
+    for collection, indexes in COMPOUND_INDEXES.items():
+        for keys in indexes:
+            specs.append((collection, keys, {}))
+    for collection, field in PREFIX_SEARCH_FIELDS.items():
+        specs.append((collection, field, {}))
+    for collection, keys, options in specs:
+        try:
+            await db[collection].create_index(keys, **options)
+        except Exception as e:
+            logger.warning("Could not create index %s on %s: %s", keys, collection, e)
+    if ATLAS_SEARCH_INDEX:
+        for collection in ATLAS_SEARCH_FIELDS:
+            try:
+                definition = _atlas_search_definition(collection)
+                existing = await db[collection].list_search_indexes(ATLAS_SEARCH_INDEX).to_list(length=1)
+                if existing:
+                    # every update makes Atlas rebuild the index, so only push real changes
+                    if existing[0].get("latestDefinition") != definition:
+                        await db[collection].update_search_index(ATLAS_SEARCH_INDEX, definition)
+                else:
+                    await db[collection].create_search_index({"name": ATLAS_SEARCH_INDEX, "definition": definition})
+            except Exception as e:
+                logger.warning("Could not create Atlas Search index on %s: %s", collection, e)
+
+# Response cache
+
+# Each cached endpoint has its own namespace, cleared by the matching write
+# handlers. The backend caps the number of stored responses, so distinct query
+# strings cannot grow process memory without bound.
+RESPONSE_CACHE_MAX_ENTRIES = 256
+CLIENTS_CACHE_TTL = 30
+CLIENTS_CACHE_NAMESPACE = "clients"
+SETTINGS_CACHE_TTL = 60
+SETTINGS_CACHE_NAMESPACE = "settings"
+
+@app.on_event("startup")
+async def init_cache():
+    FastAPICache.init(BoundedInMemoryBackend(max_entries=RESPONSE_CACHE_MAX_ENTRIES))
+
+# Utility functions for simple queries
+
+# Upper bound for the `limit` parameter of every list endpoint
+MAX_LIST_LIMIT = 500
+
+# Upper bound for the number of documents in one bulk insert request
+MAX_BULK_INSERT = 1000
+
+# Large fields left out of list responses unless requested through `fields`
+INVOICE_LIST_PROJECTION = {"items": 0, "notes": 0}
+LEGAL_DOC_LIST_PROJECTION = {"content": 0}
+
+def _projection(fields: Optional[str] = None, default: Optional[Dict[str, int]] = None) -> Optional[Dict[str, int]]:
+    # comma separated `fields` selects what to return, otherwise drop the bulky defaults
+    if fields:
+        names = [field.strip() for field in fields.split(",") if field.strip()]
+        if any("$" in name or "" in name.split(".") for name in names):
+            # operators or empty path segments would otherwise surface as a Mongo error (500)
+            raise HTTPException(status_code=400, detail="Invalid field name in fields")
+        # a parent path already includes its children, and listing both is a Mongo path collision
+        selected = set(names)
+        return {name: 1 for name in names if not any(name.startswith(parent + ".") for parent in selected)}
+    return default
+
+def _atlas_search_stage(collection: str, q: str, extra: Optional[Dict[str, Any]] = None, prefix: Optional[str] = None) -> Dict[str, Any]:
+    # relevance comes from the text clause, filters only narrow the hits
+    config = ATLAS_SEARCH_FIELDS[collection]
+    filters: List[Dict[str, Any]] = [
+        {"equals": {"path": field, "value": value}} for field, value in (extra or {}).items()
+    ]
+    if prefix:
+        escaped = re.sub(r"([*?\\])", r"\\\1", prefix)
+        filters.append({"wildcard": {"path": {"value": PREFIX_SEARCH_FIELDS[collection], "multi": "keyword"}, "query": f"{escaped}*"}})
+    return {
+        "$search": {
+            "index": ATLAS_SEARCH_INDEX,
+            "compound": {
+                "must": [{"text": {"query": q, "path": config["text"]}}],
+                "filter": filters,
+            },
+        }
+    }
 
-def _query(collection: str, q: Optional[str] = None, extra: Optional[Dict[str, Any]] = None, limit: int = 50):
+def _build_query(collection: str, q: Optional[str] = None, extra: Optional[Dict[str, Any]] = None, limit: int = 50, prefix: Optional[str] = None, projection: Optional[Dict[str, int]] = None) -> Tuple[Dict[str, Any], Optional[list], Optional[List[Dict[str, Any]]]]:
+    # returns (filter, sort, pipeline); pipeline is only set when Atlas Search handles q
+    if q and ATLAS_SEARCH_INDEX and collection in ATLAS_SEARCH_FIELDS:
+        pipeline: List[Dict[str, Any]] = [_atlas_search_stage(collection, q, extra, prefix)]
+        pipeline.append({"$limit": limit})
+        if projection:
+            pipeline.append({"$project": projection})
+        return {}, None, pipeline
     filter_dict: Dict[str, Any] = extra.copy() if extra else {}
+    if prefix:
+        # anchored and case-sensitive so the index prefix scan can be used
+        filter_dict[PREFIX_SEARCH_FIELDS[collection]] = {"$regex": f"^{re.escape(prefix)}"}
+    sort = None
     if q:
-        # naive regex search on some common keys
-        filter_dict["$or"] = [
-            {"title": {"$regex": q, "$options": "i"}},
-            {"name": {"$regex": q, "$options": "i"}},
-            {"description": {"$regex": q, "$options": "i"}},
-            {"content": {"$regex": q, "$options": "i"}},
-        ]
-    return get_documents(collection, filter_dict, limit)
+        # full-text search backed by the text_search index, best matches first
+        filter_dict["$text"] = {"$search": q}
+        sort = [("score", {"$meta": "textScore"})]
+    return filter_dict, sort, None
+
+async def _bulk_insert(collection: str, payload: list):
+    ids, errors = await create_documents(collection, payload)
+    if errors:
+        # partial success under ordered=False, report both sides
+        return ORJSONResponse({"ids": ids, "errors": errors}, status_code=207)
+    return {"ids": ids}
+
+async def _query(collection: str, q: Optional[str] = None, extra: Optional[Dict[str, Any]] = None, limit: int = 50, prefix: Optional[str] = None, projection: Optional[Dict[str, int]] = None):
+    filter_dict, sort, pipeline = _build_query(collection, q, extra, limit, prefix, projection)
+    if pipeline is not None:
+        return await aggregate_documents(collection, pipeline, limit)
+    return await get_documents(collection, filter_dict, limit, sort=sort, projection=projection)
+
+async def _stream_query(collection: str, q: Optional[str] = None, extra: Optional[Dict[str, Any]] = None, limit: int = 50, prefix: Optional[str] = None, projection: Optional[Dict[str, int]] = None) -> StreamingResponse:
+    # same results as _query, written out as NDJSON while the cursor is read
+    if db is None:
+        raise HTTPException(status_code=503, detail="Database not available")
+    filter_dict, sort, pipeline = _build_query(collection, q, extra, limit, prefix, projection)
+    if pipeline is not None:
+        documents = iter_aggregate(collection, pipeline)
+    else:
+        documents = iter_documents(collection, filter_dict, limit, sort=sort, projection=projection)
+
+    # Read the first batch before the 200 headers go out, so query errors still
+    # surface as a normal error response instead of a truncated stream.
+    try:
+        first = await documents.__anext__()
+    except StopAsyncIteration:
+        first = None
+
+    async def ndjson():
+        if first is None:
+            return
+        yield orjson.dumps(first, default=str) + b"\n"
+        async for document in documents:
+            yield orjson.dumps(document, default=str) + b"\n"
+
+    # X-Accel-Buffering tells nginx to pass chunks on as they arrive
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson", headers={"X-Accel-Buffering": "no"})
 
 # Clients (Mandatory)
 
 @app.post("/clients")
-def create_client(payload: Client):
-    _id = create_document("client", payload)
+async def create_client(payload: Client):
+    _id = await create_document("client", payload)
+    await FastAPICache.clear(namespace=CLIENTS_CACHE_NAMESPACE)
     return {"id": _id}
 
+@app.post("/clients/bulk")
+async def bulk_create_clients(payload: List[Client] = Body(..., min_length=1, max_length=MAX_BULK_INSERT)):
+    response = await _bulk_insert("client", payload)
+    await FastAPICache.clear(namespace=CLIENTS_CACHE_NAMESPACE)
+    return response
+
 @app.get("/clients")
-def list_clients(q: Optional[str] = Query(None), limit: int = 50):
-    return _query("client", q=q, limit=limit)
+@cache(expire=CLIENTS_CACHE_TTL, namespace=CLIENTS_CACHE_NAMESPACE, coder=JsonBodyCoder)
+async def list_clients(q: Optional[str] = Query(None), prefix: Optional[str] = Query(None), fields: Optional[str] = Query(None), limit: int = Query(50, ge=1, le=MAX_LIST_LIMIT)):
+    return await _query("client", q=q, limit=limit, prefix=prefix, projection=_projection(fields))
 
 # Cases (Mandatory)
 
 @app.post("/cases")
-def create_case(payload: Case):
-    _id = create_document("case", payload)
+async def create_case(payload: Case):
+    _id = await create_document("case", payload)
     return {"id": _id}
 
+@app.post("/cases/bulk")
+async def bulk_create_cases(payload: List[Case] = Body(..., min_length=1, max_length=MAX_BULK_INSERT)):
+    return await _bulk_insert("case", payload)
+
 @app.get("/cases")
-def list_cases(q: Optional[str] = Query(None), client_id: Optional[str] = None, status: Optional[str] = None, limit: int = 50):
+async def list_cases(q: Optional[str] = Query(None), prefix: Optional[str] = Query(None), client_id: Optional[str] = None, status: Optional[str] = None, fields: Optional[str] = Query(None), limit: int = Query(50, ge=1, le=MAX_LIST_LIMIT)):
     extra: Dict[str, Any] = {}
     if client_id:
         extra["client_id"] = client_id
     if status:
         extra["status"] = status
-    return _query("case", q=q, extra=extra, limit=limit)
+    return await _query("case", q=q, extra=extra, limit=limit, prefix=prefix, projection=_projection(fields))
+
+@app.get("/cases/{case_id}/full")
+async def get_case_full(case_id: str):
+    # Case with its tasks and invoices in a single aggregation round trip
+    try:
+        oid = ObjectId(case_id)
+    except InvalidId:
+        raise HTTPException(status_code=400, detail="Invalid case id")
+    pipeline = [
+        {"$match": {"_id": oid}},
+        # related documents store the case id as a string, see Task.case_id
+        {"$addFields": {"_case_id": {"$toString": "$_id"}}},
+        # bounded so a large case stays under the 16MB document limit
+        {"$lookup": {"from": "task", "localField": "_case_id", "foreignField": "case_id", "pipeline": [{"$limit": MAX_LIST_LIMIT}], "as": "tasks"}},
+        {"$lookup": {"from": "invoice", "localField": "_case_id", "foreignField": "case_id", "pipeline": [{"$limit": MAX_LIST_LIMIT}], "as": "invoices"}},
+        {"$project": {"_case_id": 0}},
+    ]
+    docs = await aggregate_documents("case", pipeline, 1, nested=["tasks", "invoices"])
+    if not docs:
+        raise HTTPException(status_code=404, detail="Case not found")
+    return docs[0]
 
 # Tasks (Mandatory)
 
 @app.post("/tasks")
-def create_task(payload: Task):
-    _id = create_document("task", payload)
+async def create_task(payload: Task):
+    _id = await create_document("task", payload)
     return {"id": _id}
 
+@app.post("/tasks/bulk")
+async def bulk_create_tasks(payload: List[Task] = Body(..., min_length=1, max_length=MAX_BULK_INSERT)):
+    return await _bulk_insert("task", payload)
+
 @app.get("/tasks")
-def list_tasks(case_id: Optional[str] = None, status: Optional[str] = None, assignee_id: Optional[str] = None, limit: int = 50):
+async def list_tasks(case_id: Optional[str] = None, status: Optional[str] = None, assignee_id: Optional[str] = None, fields: Optional[str] = Query(None), limit: int = Query(50, ge=1, le=MAX_LIST_LIMIT)):
     extra: Dict[str, Any] = {}
     if case_id:
         extra["case_id"] = case_id
@@ -106,17 +362,21 @@ def list_tasks(case_id: Optional[str] = None, status: Optional[str] = None, assi
         extra["status"] = status
     if assignee_id:
         extra["assignee_id"] = assignee_id
-    return get_documents("task", extra, limit)
+    return await get_documents("task", extra, limit, projection=_projection(fields))
 
 # Billing (Mandatory)
 
 @app.post("/invoices")
-def create_invoice(payload: Invoice):
-    _id = create_document("invoice", payload)
+async def create_invoice(payload: Invoice):
+    _id = await create_document("invoice", payload)
     return {"id": _id}
 
+@app.post("/invoices/bulk")
+async def bulk_create_invoices(payload: List[Invoice] = Body(..., min_length=1, max_length=MAX_BULK_INSERT)):
+    return await _bulk_insert("invoice", payload)
+
 @app.get("/invoices")
-def list_invoices(client_id: Optional[str] = None, case_id: Optional[str] = None, status: Optional[str] = None, limit: int = 50):
+async def list_invoices(client_id: Optional[str] = None, case_id: Optional[str] = None, status: Optional[str] = None, fields: Optional[str] = Query(None), limit: int = Query(50, ge=1, le=MAX_LIST_LIMIT)):
     extra: Dict[str, Any] = {}
     if client_id:
         extra["client_id"] = client_id
@@ -124,33 +384,45 @@ def list_invoices(client_id: Optional[str] = None, case_id: Optional[str] = None
         extra["case_id"] = case_id
     if status:
         extra["status"] = status
-    return get_documents("invoice", extra, limit)
+    return await get_documents("invoice", extra, limit, projection=_projection(fields, INVOICE_LIST_PROJECTION))
 
 # Settings (Mandatory)
 
 @app.post("/settings")
-def create_setting(payload: Setting):
-    _id = create_document("setting", payload)
+async def create_setting(payload: Setting):
+    _id = await create_document("setting", payload)
+    await FastAPICache.clear(namespace=SETTINGS_CACHE_NAMESPACE)
     return {"id": _id}
 
+@app.post("/settings/bulk")
+async def bulk_create_settings(payload: List[Setting] = Body(..., min_length=1, max_length=MAX_BULK_INSERT)):
+    response = await _bulk_insert("setting", payload)
+    await FastAPICache.clear(namespace=SETTINGS_CACHE_NAMESPACE)
+    return response
+
 @app.get("/settings")
-def list_settings(scope: Optional[str] = None, user_id: Optional[str] = None, limit: int = 100):
+@cache(expire=SETTINGS_CACHE_TTL, namespace=SETTINGS_CACHE_NAMESPACE, coder=JsonBodyCoder)
+async def list_settings(scope: Optional[str] = None, user_id: Optional[str] = None, fields: Optional[str] = Query(None), limit: int = Query(100, ge=1, le=MAX_LIST_LIMIT)):
     extra: Dict[str, Any] = {}
     if scope:
         extra["scope"] = scope
     if user_id:
         extra["user_id"] = user_id
-    return get_documents("setting", extra, limit)
+    return await get_documents("setting", extra, limit, projection=_projection(fields))
 
 # Legal Database (100k+ documents ready)
 
 @app.post("/legal-docs")
-def create_legal_doc(payload: LegalDocument):
-    _id = create_document("legaldocument", payload)
+async def create_legal_doc(payload: LegalDocument):
+    _id = await create_document("legaldocument", payload)
     return {"id": _id}
 
-@app.get("/legal-docs")
-def search_legal_docs(q: Optional[str] = Query(None), practice_area: Optional[str] = None, jurisdiction: Optional[str] = None, year: Optional[int] = None, limit: int = 50):
+@app.post("/legal-docs/bulk")
+async def bulk_create_legal_docs(payload: List[LegalDocument] = Body(..., min_length=1, max_length=MAX_BULK_INSERT)):
+    return await _bulk_insert("legaldocument", payload)
+
+async def _legal_doc_query(q: Optional[str] = Query(None), prefix: Optional[str] = Query(None), practice_area: Optional[str] = None, jurisdiction: Optional[str] = None, year: Optional[int] = None, limit: int = Query(50, ge=1, le=MAX_LIST_LIMIT)) -> Dict[str, Any]:
+    # query parameters shared by the list and stream variants of legal doc search
     extra: Dict[str, Any] = {}
     if practice_area:
         extra["practice_area"] = practice_area
@@ -158,45 +430,63 @@ def search_legal_docs(q: Optional[str] = Query(None), practice_area: Optional[st
         extra["jurisdiction"] = jurisdiction
     if year:
         extra["year"] = year
-    return _query("legaldocument", q=q, extra=extra, limit=limit)
+    return {"q": q, "extra": extra, "limit": limit, "prefix": prefix}
+
+@app.get("/legal-docs")
+async def search_legal_docs(query: Dict[str, Any] = Depends(_legal_doc_query), fields: Optional[str] = Query(None)):
+    return await _query("legaldocument", projection=_projection(fields, LEGAL_DOC_LIST_PROJECTION), **query)
+
+@app.get("/legal-docs/stream")
+async def stream_legal_docs(query: Dict[str, Any] = Depends(_legal_doc_query), fields: Optional[str] = Query(None)):
+    # whole documents by default: long content bodies are what streaming is for
+    return await _stream_query("legaldocument", projection=_projection(fields), **query)
 
 # AI Assistant conversation storage (messages)
 
 @app.post("/assistant/messages")
-def add_message(payload: AssistantMessage):
-    _id = create_document("assistantmessage", payload)
+async def add_message(payload: AssistantMessage):
+    _id = await create_document("assistantmessage", payload)
     return {"id": _id}
 
+@app.post("/assistant/messages/bulk")
+async def bulk_create_messages(payload: List[AssistantMessage] = Body(..., min_length=1, max_length=MAX_BULK_INSERT)):
+    return await _bulk_insert("assistantmessage", payload)
+
 @app.get("/assistant/messages")
-def list_messages(conversation_id: Optional[str] = None, related_case_id: Optional[str] = None, limit: int = 100):
+async def list_messages(conversation_id: Optional[str] = None, related_case_id: Optional[str] = None, fields: Optional[str] = Query(None), limit: int = Query(100, ge=1, le=MAX_LIST_LIMIT)):
     extra: Dict[str, Any] = {}
     if conversation_id:
         extra["conversation_id"] = conversation_id
     if related_case_id:
         extra["related_case_id"] = related_case_id
-    return get_documents("assistantmessage", extra, limit)
+    return await get_documents("assistantmessage", extra, limit, projection=_projection(fields))
 
 # Schema endpoint to expose available collections
 
 class SchemaResponse(BaseModel):
     collections: List[str]
 
+# Read classes from schemas and convert to collection names. The response is
+# constant, so it is built once at import instead of on every request.
+_SCHEMA = SchemaResponse(collections=[
+    "client",
+    "case",
+    "task",
+    "invoice",
+    "setting",
+    "legaldocument",
+    "assistantmessage",
+])
+
+# Encoded once as well; returning a Response skips response_model validation,
+# which is kept only to document the shape in OpenAPI.
+_SCHEMA_JSON = _SCHEMA.model_dump_json().encode()
+
 @app.get("/schema", response_model=SchemaResponse)
-def get_schema():
-    # Read classes from schemas and convert to collection names
-    collections = [
-        "client",
-        "case",
-        "task",
-        "invoice",
-        "setting",
-        "legaldocument",
-        "assistantmessage",
-    ]
-    return {"collections": collections}
+async def get_schema():
+    return Response(_SCHEMA_JSON, media_type="application/json")
 
 
 if __name__ == "__main__":
     import uvicorn
-    port = int(os.getenv("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    uvicorn.run(app, host="0.0.0.0", port=settings.port)
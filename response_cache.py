@@ -0,0 +1,84 @@
+"""
+Response Cache Helpers
+
+Backend and coder used by the fastapi-cache decorators in main.py.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from fastapi_cache.backends import Backend
+from fastapi_cache.coder import Coder
+
+class BoundedInMemoryBackend(Backend):
+    """In-process TTL cache holding at most `max_entries` responses.
+
+    fastapi-cache's InMemoryBackend only drops an expired entry when the same
+    key is read again, so every distinct query string would stay in memory.
+    Here expired entries are purged on each write and the least recently used
+    ones are evicted beyond the cap.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self._store: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._max_entries = max_entries
+
+    def _get(self, key: str) -> Optional[Tuple[float, Any]]:
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._store[key]
+            return None
+        self._store.move_to_end(key)
+        return entry
+
+    async def get_with_ttl(self, key: str) -> Tuple[int, Any]:
+        entry = self._get(key)
+        if entry is None:
+            return 0, None
+        return max(int(entry[0] - time.monotonic()), 0), entry[1]
+
+    async def get(self, key: str) -> Any:
+        entry = self._get(key)
+        return entry[1] if entry else None
+
+    async def set(self, key: str, value: Any, expire: Optional[int] = None):
+        now = time.monotonic()
+        for stale in [k for k, (expires_at, _) in self._store.items() if expires_at <= now]:
+            del self._store[stale]
+        self._store[key] = (now + expire if expire else float("inf"), value)
+        self._store.move_to_end(key)
+        while len(self._store) > self._max_entries:
+            self._store.popitem(last=False)
+
+    async def clear(self, namespace: Optional[str] = None, key: Optional[str] = None) -> int:
+        if namespace:
+            keys = [k for k in self._store if k.startswith(namespace)]
+        elif key:
+            keys = [key] if key in self._store else []
+        else:
+            keys = list(self._store)
+        for k in keys:
+            del self._store[k]
+        return len(keys)
+
+class JsonBodyCoder(Coder):
+    """Store the JSON-ready form of a response and hand it back unchanged.
+
+    The default JsonCoder round-trips datetimes through pendulum, which turns
+    Motor's naive datetimes into UTC-aware ones, so cached responses would not
+    match uncached ones. Encoding with jsonable_encoder, as FastAPI does for the
+    uncached response, keeps both identical.
+    """
+
+    @classmethod
+    def encode(cls, value: Any) -> bytes:
+        return orjson.dumps(jsonable_encoder(value))
+
+    @classmethod
+    def decode(cls, value: bytes) -> Any:
+        return orjson.loads(value)
@@ -7,10 +7,27 @@ name is the lowercase of the class name (e.g., Case -> "case").
 These schemas will be returned by GET /schema for external tools/viewers.
 """
 
-from pydantic import BaseModel, Field
-from typing import Optional, List, Literal, Dict
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional, List, Literal
 from datetime import datetime
 
+# Embedded documents (stored inside a parent collection, not collections themselves).
+# Extra keys are kept, these used to be free-form dicts and clients may send more.
+
+class ChecklistItem(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+    text: str
+    done: bool = False
+
+class InvoiceItem(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+    description: str
+    hours: Optional[float] = Field(None, ge=0)
+    rate: Optional[float] = Field(None, ge=0)
+    amount: float
+
 # Core entities (Mandatory)
 
 class Client(BaseModel):
@@ -43,14 +60,14 @@ class Task(BaseModel):
     status: Literal["todo", "in_progress", "done"] = Field("todo")
     priority: Literal["low", "medium", "high", "urgent"] = Field("medium")
     due_date: Optional[datetime] = Field(None)
-    checklist: List[Dict[str, object]] = Field(default_factory=list, description="[{text, done}]")
+    checklist: List[ChecklistItem] = Field(default_factory=list)
 
 class Invoice(BaseModel):
     client_id: str = Field(..., description="Client id")
     case_id: Optional[str] = Field(None, description="Case id")
     number: Optional[str] = Field(None, description="Invoice number")
     currency: Literal["USD", "EUR", "GBP", "AUD", "CAD", "INR", "JPY", "CNY"] = Field("USD")
-    items: List[Dict[str, object]] = Field(default_factory=list, description="[{description, hours, rate, amount}]")
+    items: List[InvoiceItem] = Field(default_factory=list)
     status: Literal["draft", "sent", "paid", "overdue", "void"] = Field("draft")
     issued_at: Optional[datetime] = Field(None)
     due_at: Optional[datetime] = Field(None)
@@ -59,7 +76,7 @@ class Invoice(BaseModel):
 
 class Setting(BaseModel):
     key: str = Field(..., description="Setting key")
-    value: Dict[str, object] = Field(default_factory=dict, description="Arbitrary JSON value")
+    value: dict = Field(default_factory=dict, description="Arbitrary JSON value")
     scope: Literal["org", "user"] = Field("org")
     user_id: Optional[str] = Field(None, description="User id if scope=user")
 
@@ -78,9 +95,9 @@ class LegalDocument(BaseModel):
 class Report(BaseModel):
     name: str
     description: Optional[str] = None
-    params: Dict[str, object] = Field(default_factory=dict)
+    params: dict = Field(default_factory=dict)
     generated_at: Optional[datetime] = None
-    data: Dict[str, object] = Field(default_factory=dict)
+    data: dict = Field(default_factory=dict)
 
 class AssistantMessage(BaseModel):
     role: Literal["user", "assistant", "system"] = "user"